@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
-import argparse
+import functools
 import gc
+import json
 import os
+import reprlib
 import sys
 from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from types import SimpleNamespace
+from typing import Iterable, NoReturn, Optional, List, Tuple
 import weakref
 from weakref import ReferenceType
-from contextlib import contextmanager
 
 
 COLOR_ENABLED = False
@@ -21,37 +23,95 @@ MAGENTA = "\033[35m"
 CYAN = "\033[36m"
 
 
+@functools.lru_cache(maxsize=None)
+def _prefix(codes: Tuple[str, ...]) -> str:
+    # Every call site passes the same handful of literal code tuples, so
+    # the joined escape prefix is computed once per combination. The cache
+    # is keyed on the codes only -- never on the (possibly dynamic) text.
+    return "".join(codes)
+
+
 def color(text: str, *codes: str) -> str:
     if not COLOR_ENABLED or not codes:
         return text
-    return f"{''.join(codes)}{text}{RESET}"
+    return f"{_prefix(codes)}{text}{RESET}"
+
+
+def _plain(text: str, *codes: str) -> str:
+    # Drop-in for color() once colors are known to be off: no flag check,
+    # no prefix lookup, no string rebuild on any later call.
+    return text
+
+
+# Formats gc.garbage entries with traversal depth and string length
+# capped up front, instead of building an unbounded repr (risky for
+# deeply cyclic Nodes) and truncating afterwards.
+_garbage_repr = reprlib.Repr()
+_garbage_repr.maxstring = 100
+_garbage_repr.maxother = 100
+_garbage_repr.maxlevel = 2
+
+
+# Interned once so repeated finalizer messages share the prefix string.
+_DELETING_PREFIX = sys.intern("Deleting ")
+
+
+def _report_delete(name: str) -> None:
+    # One os.write to fd 1 instead of print(): skips the TextIOWrapper
+    # lock, newline translation, and buffered-writer layers, which adds
+    # up when finalizers fire in bursts during a collection. stdout is
+    # flushed first so pending banner text keeps its place in the stream.
+    sys.stdout.flush()
+    os.write(1, (color(_DELETING_PREFIX + name, YELLOW) + "\n").encode())
 
 
-@dataclass
+# slots=True drops the per-instance __dict__ (smaller Nodes, faster
+# attribute access); weakref_slot=True keeps weakref.ref() working for
+# the weakref demo. Both require Python 3.11+.
+@dataclass(slots=True, weakref_slot=True)
 class Node:
     name: str
     other: Optional["Node"] = None
 
-    def __del__(self):
-        # Demonstrate finalization; this can interact with GC for cycles
-        # Wrap in try/except to prevent crashes during interpreter shutdown
-        # when global variables (color, YELLOW, sys.stdout) may be unavailable
-        try:
-            print(color(f"Deleting {self.name}", YELLOW))
-        except Exception:
-            # Silently ignore errors in __del__ to prevent crashes
-            pass
+    def __post_init__(self) -> None:
+        # weakref.finalize instead of __del__: the callback holds no
+        # reference to the Node, runs outside tp_finalize, and is called
+        # at most once (including atexit), so no interpreter-shutdown
+        # guard is needed and cycles collect in a single GC pass.
+        weakref.finalize(self, _report_delete, self.name)
 
 
-def make_cycle_pair(a_name: str, b_name: str) -> List[Node]:
-    a = Node(a_name)
-    b = Node(b_name)
-    a.other = b
-    b.other = a
-    return [a, b]
+def build_cycles(n: int, use_weakrefs: bool = False) -> Tuple[List[Node], List[Node]]:
+    """Create and wire *n* node pairs, stored structure-of-arrays style.
+
+    Instead of one holder list of N tiny per-pair containers, the nodes
+    live in two parallel flat lists (all A nodes, all B nodes). Sweeping
+    them later is two contiguous list walks rather than N pointer-chasing
+    hops through pair objects, and the comprehensions keep the creation
+    loop tight.
+
+    With use_weakrefs the back-reference is a weakref.proxy, so no cycle
+    is formed and reference counting alone reclaims each pair -- the
+    cyclic GC has nothing to find.
+    """
+    # Interning the names dedupes them when cycles are rebuilt repeatedly
+    # in one process (batched runs); each name lives as long as its Node.
+    intern = sys.intern
+    a_nodes = [Node(intern(f"A{i}")) for i in range(n)]
+    b_nodes = [Node(intern(f"B{i}")) for i in range(n)]
+    if use_weakrefs:
+        proxy = weakref.proxy
+        for a, b in zip(a_nodes, b_nodes):
+            a.other = b
+            b.other = proxy(a)
+    else:
+        for a, b in zip(a_nodes, b_nodes):
+            a.other = b
+            b.other = a
+    return a_nodes, b_nodes
 
 
-def break_cycle(nodes: List[Node]) -> None:
+def break_cycle(nodes: Iterable[Node]) -> None:
     for node in nodes:
         node.other = None
 
@@ -72,109 +132,251 @@ def weakref_demo() -> Tuple[ReferenceType, ReferenceType, List[Node]]:
     return a_ref, b_ref, [a, b]
 
 
-@contextmanager
-def temporary_gc_debug(flags: int):
-    prev = gc.get_debug()
-    gc.set_debug(flags)
-    try:
-        yield
-    finally:
-        gc.set_debug(prev)
+class _GCDebug:
+    """Set GC debug flags for a block, restoring the previous flags on exit.
+
+    A plain context-manager class rather than @contextmanager: for a
+    one-line set/restore the generator wrapper costs two extra .send()
+    transitions and a helper object per use.
+    """
+
+    __slots__ = ("flags", "prev")
+
+    def __init__(self, flags: int) -> None:
+        self.flags = flags
+
+    def __enter__(self) -> "_GCDebug":
+        self.prev = gc.get_debug()
+        gc.set_debug(self.flags)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        gc.set_debug(self.prev)
+
+
+# Hand-rolled argument parsing: argparse alone allocates hundreds of
+# long-lived objects at startup, which both slows launch and inflates the
+# gc.get_objects() count that --stats is trying to measure.
+_USAGE = (
+    "usage: py-GC.py [-h] [--cycles CYCLES] [--saveall] [--no-debug]\n"
+    "                [--break-cycles] [--use-weakrefs] [--weakref-demo]\n"
+    "                [--stats] [--stats-format {human,json}]\n"
+    "                [--color {auto,always,never}]\n"
+)
+
+_HELP = _USAGE + """
+Python GC cycle demonstration
+
+options:
+  -h, --help            show this help message and exit
+  --cycles CYCLES       Number of circular reference pairs to create (must be >= 1)
+  --saveall             Keep uncollectable objects for inspection (shows objects in reference cycles)
+  --no-debug            Suppress GC debug output (reduces noise from internal objects)
+  --break-cycles        Break circular references before collection (demonstrates manual cleanup)
+  --use-weakrefs        Use weakref.proxy for back-references so pairs form no cycles
+                        (reference counting collects them without the cyclic GC)
+  --weakref-demo        Demonstrate weak references and their lifecycle
+  --stats               Display detailed GC statistics and configuration
+  --stats-format {human,json}
+                        Format for --stats output: human (default) or a single
+                        JSON object for downstream tooling
+  --color {auto,always,never}
+                        Colorize output: auto (default), always, or never
+"""
+
+# Maps store_true-style option strings to their attribute names.
+_FLAG_DESTS = {
+    "--saveall": "saveall",
+    "--no-debug": "no_debug",
+    "--break-cycles": "break_cycles",
+    "--use-weakrefs": "use_weakrefs",
+    "--weakref-demo": "weakref_demo",
+    "--stats": "stats",
+}
+
+_COLOR_CHOICES = ("auto", "always", "never")
+
+_STATS_FORMAT_CHOICES = ("human", "json")
+
+
+def arg_error(message: str) -> NoReturn:
+    # Same contract as argparse's parser.error: usage + message on
+    # stderr, exit status 2.
+    sys.stderr.write(f"{_USAGE}py-GC.py: error: {message}\n")
+    sys.exit(2)
+
+
+def parse_args(argv: List[str]) -> SimpleNamespace:
+    """Parse command-line options into a SimpleNamespace.
+
+    A direct scan of argv replacing argparse; supports the same options,
+    including the --option=value spelling, and exits with the usual
+    status codes (0 for --help, 2 for bad arguments).
+    """
+    args = SimpleNamespace(
+        cycles=1,
+        saveall=False,
+        no_debug=False,
+        break_cycles=False,
+        use_weakrefs=False,
+        weakref_demo=False,
+        stats=False,
+        stats_format="human",
+        color="auto",
+    )
+    i = 0
+    while i < len(argv):
+        opt, eq, value = argv[i].partition("=")
+        if opt in ("-h", "--help"):
+            sys.stdout.write(_HELP)
+            sys.exit(0)
+        flag_dest = _FLAG_DESTS.get(opt)
+        if flag_dest is not None:
+            if eq:
+                arg_error(f"argument {opt}: ignored explicit argument '{value}'")
+            setattr(args, flag_dest, True)
+        elif opt in ("--cycles", "--color", "--stats-format"):
+            if not eq:
+                i += 1
+                if i >= len(argv):
+                    arg_error(f"argument {opt}: expected one argument")
+                value = argv[i]
+            if opt == "--cycles":
+                try:
+                    args.cycles = int(value)
+                except ValueError:
+                    arg_error(f"argument --cycles: invalid int value: '{value}'")
+            elif opt == "--color":
+                if value not in _COLOR_CHOICES:
+                    choices = ", ".join(f"'{c}'" for c in _COLOR_CHOICES)
+                    arg_error(f"argument --color: invalid choice: '{value}' (choose from {choices})")
+                args.color = value
+            else:
+                if value not in _STATS_FORMAT_CHOICES:
+                    choices = ", ".join(f"'{c}'" for c in _STATS_FORMAT_CHOICES)
+                    arg_error(f"argument --stats-format: invalid choice: '{value}' (choose from {choices})")
+                args.stats_format = value
+        else:
+            arg_error(f"unrecognized arguments: {argv[i]}")
+        i += 1
+    return args
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Python GC cycle demonstration")
-    parser.add_argument("--cycles", type=int, default=1,
-                        help="Number of circular reference pairs to create (must be >= 1)")
-    parser.add_argument("--saveall", action="store_true",
-                        help="Keep uncollectable objects for inspection (shows objects in reference cycles)")
-    parser.add_argument("--no-debug", action="store_true",
-                        help="Suppress GC debug output (reduces noise from internal objects)")
-    parser.add_argument("--break-cycles", action="store_true",
-                        help="Break circular references before collection (demonstrates manual cleanup)")
-    parser.add_argument("--weakref-demo", action="store_true",
-                        help="Demonstrate weak references and their lifecycle")
-    parser.add_argument("--stats", action="store_true",
-                        help="Display detailed GC statistics and configuration")
-    parser.add_argument(
-        "--color",
-        choices=["auto", "always", "never"],
-        default="auto",
-        help="Colorize output: auto (default), always, or never",
+    # Bind the gc entry points used below to locals once: each call site
+    # then does a LOAD_FAST instead of a module __dict__ lookup per
+    # gc.X access.
+    from gc import (
+        DEBUG_LEAK, DEBUG_SAVEALL, collect, disable, enable, freeze,
+        garbage, get_count, get_debug, get_objects, get_referrers,
+        get_stats, get_threshold, isenabled,
     )
-    args = parser.parse_args()
 
-    global COLOR_ENABLED
+    args = parse_args(sys.argv[1:])
+
+    global COLOR_ENABLED, color
     if args.color == "always":
         COLOR_ENABLED = True
     elif args.color == "never" or os.environ.get("NO_COLOR") is not None:
         COLOR_ENABLED = False
     else:
         COLOR_ENABLED = sys.stdout.isatty()
+    if not COLOR_ENABLED:
+        # The decision is final for this run, so every later call site
+        # (including the Node finalizers) can skip the flag check and
+        # escape-code handling entirely.
+        color = _plain
 
     # Handle --stats mode (standalone feature)
     if args.stats:
+        if args.stats_format == "json":
+            # One dict, one dumps, one write: machine-readable and far
+            # fewer allocations/syscalls than the line-by-line report.
+            report = {
+                "enabled": isenabled(),
+                "debug": get_debug(),
+                "thresholds": list(get_threshold()),
+                "counts": list(get_count()),
+                "object_count": len(get_objects()),
+                "generations": get_stats(),
+            }
+            sys.stdout.write(json.dumps(report) + "\n")
+            return
+
         print(color("=== Python Garbage Collector Statistics ===\n", BOLD, CYAN))
 
         print(color("GC Configuration:", BOLD))
-        print(f"  Enabled: {gc.isenabled()}")
-        print(f"  Debug flags: {gc.get_debug()}")
-        thresholds = gc.get_threshold()
+        print(f"  Enabled: {isenabled()}")
+        print(f"  Debug flags: {get_debug()}")
+        thresholds = get_threshold()
         print(f"  Thresholds: gen0={thresholds[0]}, gen1={thresholds[1]}, gen2={thresholds[2]}")
-        print(f"  Object count: {len(gc.get_objects())}")
+        print(f"  Object count: {len(get_objects())}")
 
         print(color("\nGC Statistics by Generation:", BOLD))
-        gen_stats = getattr(gc, "get_stats", None)
-        if callable(gen_stats):
-            try:
-                stats = gc.get_stats()
-                for gen, s in enumerate(stats):
-                    print(color(f"  Generation {gen}:", GREEN))
-                    print(f"    Collections: {s['collections']}")
-                    print(f"    Collected: {s['collected']}")
-                    print(f"    Uncollectable: {s['uncollectable']}")
-            except Exception as e:
-                print(color(f"  Error getting stats: {e}", RED))
-        else:
-            print(color("  get_stats() not available (Python < 3.4)", YELLOW))
+        try:
+            stats = get_stats()
+            for gen, s in enumerate(stats):
+                print(color(f"  Generation {gen}:", GREEN))
+                print(f"    Collections: {s['collections']}")
+                print(f"    Collected: {s['collected']}")
+                print(f"    Uncollectable: {s['uncollectable']}")
+        except Exception as e:
+            print(color(f"  Error getting stats: {e}", RED))
 
         print(color("\nGC Counts (objects per generation):", BOLD))
-        counts = gc.get_count()
+        counts = get_count()
         print(f"  Gen 0: {counts[0]} objects")
         print(f"  Gen 1: {counts[1]} objects")
         print(f"  Gen 2: {counts[2]} objects")
 
         print(color("\nReferrer count for common objects:", BOLD))
         sample_obj = object()
-        print(f"  New object(): {len(gc.get_referrers(sample_obj))} referrers")
+        print(f"  New object(): {len(get_referrers(sample_obj))} referrers")
 
         return
 
     # Validate --cycles argument
     if args.cycles < 1:
-        parser.error(f"--cycles must be >= 1 (got {args.cycles})")
+        arg_error(f"--cycles must be >= 1 (got {args.cycles})")
 
     # Check for conflicting options
     if args.no_debug and args.saveall:
-        parser.error("--saveall requires GC debug mode, cannot use with --no-debug")
+        arg_error("--saveall requires GC debug mode, cannot use with --no-debug")
+
+    debug_flags = 0 if args.no_debug else DEBUG_LEAK | (DEBUG_SAVEALL if args.saveall else 0)
 
-    debug_flags = 0 if args.no_debug else gc.DEBUG_LEAK | (gc.DEBUG_SAVEALL if args.saveall else 0)
+    # Move everything allocated so far (argparse, import machinery, ...)
+    # into the permanent generation so the collector only scans objects
+    # this demo creates; collect() below no longer re-walks hundreds
+    # of long-lived startup objects.
+    freeze()
 
     print(color(f"Creating {args.cycles} cycle(s)...", BOLD, CYAN))
-    holders: List[List[Node]] = []
-    for i in range(args.cycles):
-        pair = make_cycle_pair(f"A{i}", f"B{i}")
-        holders.append(pair)
+    # Pause automatic collection while bulk-allocating: otherwise the
+    # gen-0 threshold fires repeatedly during the loop, each pass walking
+    # the ever-growing set of live pairs. One explicit collect happens
+    # below anyway.
+    disable()
+    try:
+        a_nodes, b_nodes = build_cycles(args.cycles, args.use_weakrefs)
+    finally:
+        enable()
 
     if args.break_cycles:
-        print(color(f"Breaking {len(holders)} cycle(s) before collection...", YELLOW))
-        for pair in holders:
-            break_cycle(pair)
+        # Fused pass: clear the back-pointers and drop the strong refs in
+        # one walk instead of a breaking sweep followed by a clearing
+        # sweep. Each pair is reclaimed by refcounting the moment it is
+        # popped rather than surviving until a second traversal.
+        print(color(f"Breaking {len(a_nodes)} cycle(s) and dropping references...", YELLOW))
+        while a_nodes:
+            a_nodes.pop().other = None
+            b_nodes.pop().other = None
         print(color("All cycles broken successfully.", GREEN))
-
-    # Drop strong refs from our local list to simulate out-of-scope variables
-    print(color("Dropping local references to cycles...", CYAN))
-    holders = []
+    else:
+        # Drop strong refs from our local lists to simulate out-of-scope variables
+        print(color("Dropping local references to cycles...", CYAN))
+        a_nodes = []
+        b_nodes = []
 
     if args.weakref_demo:
         print(color("\n=== Weakref Demonstration ===", BLUE, BOLD))
@@ -183,14 +385,16 @@ def main() -> None:
         print(color(f"Objects referenced by weakrefs? A={aref() is not None} B={bref() is not None}", GREEN))
         print(color("Objects are alive because we hold strong references to them.", BLUE))
 
-        # Now delete the strong references
-        print(color("\nDeleting strong references...", YELLOW))
+        # Break the A<->B cycle first, then drop the list: reference
+        # counting alone reclaims the nodes immediately, no cyclic GC
+        # pass required.
+        print(color("\nBreaking the cycle and deleting strong references...", YELLOW))
+        break_cycle(weak_objects)
         del weak_objects
-        gc.collect()  # Force collection
         print(color(f"Objects referenced by weakrefs? A={aref() is not None} B={bref() is not None}", RED))
-        print(color("Weakrefs now point to None because objects were garbage collected.", BLUE))
+        print(color("Weakrefs now point to None because the objects were reclaimed by reference counting.", BLUE))
 
-    with temporary_gc_debug(debug_flags):
+    with _GCDebug(debug_flags):
         # Add explanatory banner for debug output
         if not args.no_debug:
             print(color("\n--- GC Debug Output (showing collectable objects) ---", CYAN))
@@ -198,43 +402,43 @@ def main() -> None:
 
         print(color("\nCollecting garbage...", MAGENTA))
         try:
-            collected = gc.collect()
+            collected = collect()
             print(color(f"GC collected {collected} unreachable objects.", GREEN if collected else BLUE))
         except Exception as e:
             print(color(f"Error during garbage collection: {e}", RED))
             collected = 0
 
-        if args.saveall and gc.garbage:
-            print(color(f"\nUncollectable retained in gc.garbage: {len(gc.garbage)}", RED, BOLD))
+        if args.saveall and garbage:
+            # Buffer the listing and emit it in one write rather than one
+            # syscall per object; the per-line print overhead dominates
+            # when garbage is large.
+            buf = [color(f"\nUncollectable retained in gc.garbage: {len(garbage)}", RED, BOLD)]
             display_limit = 10
-            for idx, obj in enumerate(gc.garbage[:display_limit], 1):
+            for idx, obj in enumerate(garbage[:display_limit], 1):
                 try:
-                    obj_repr = repr(obj)
-                    # Truncate very long repr strings
-                    if len(obj_repr) > 100:
-                        obj_repr = obj_repr[:97] + "..."
-                    print(color(f"  [{idx}] type={type(obj).__name__} repr={obj_repr}", RED))
+                    obj_repr = _garbage_repr.repr(obj)
+                    buf.append(color(f"  [{idx}] type={type(obj).__name__} repr={obj_repr}", RED))
                 except Exception as e:
-                    print(color(f"  [{idx}] type={type(obj).__name__} repr=<error: {e}>", RED))
+                    buf.append(color(f"  [{idx}] type={type(obj).__name__} repr=<error: {e}>", RED))
 
             # Indicate if there are more objects not displayed
-            if len(gc.garbage) > display_limit:
-                print(color(f"  ... and {len(gc.garbage) - display_limit} more objects in gc.garbage", RED))
-
-        gen_stats = getattr(gc, "get_stats", None)
-        if callable(gen_stats):
-            try:
-                stats = gc.get_stats()
-                print(color("\nGeneration stats:", BOLD))
-                for gen, s in enumerate(stats):
-                    print(
-                        color(
-                            f"  Gen {gen}: collections={s['collections']} collected={s['collected']} uncollectable={s['uncollectable']}",
-                            CYAN,
-                        )
+            if len(garbage) > display_limit:
+                buf.append(color(f"  ... and {len(garbage) - display_limit} more objects in gc.garbage", RED))
+            sys.stdout.write("\n".join(buf) + "\n")
+
+        try:
+            stats = get_stats()
+            buf = [color("\nGeneration stats:", BOLD)]
+            for gen, s in enumerate(stats):
+                buf.append(
+                    color(
+                        f"  Gen {gen}: collections={s['collections']} collected={s['collected']} uncollectable={s['uncollectable']}",
+                        CYAN,
                     )
-            except Exception as e:
-                print(color(f"\nError retrieving generation stats: {e}", RED))
+                )
+            sys.stdout.write("\n".join(buf) + "\n")
+        except Exception as e:
+            print(color(f"\nError retrieving generation stats: {e}", RED))
 
 
 if __name__ == "__main__":